@@ -1,3 +1,14 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
 def binary_search(list, target):
     """ 
     If found returns the index position of the target, else returns None
@@ -24,6 +35,57 @@ def binary_search(list, target):
     
     return None
 
+if njit is not None:
+    @njit(cache=True) # cache=True reuses the compiled code between runs
+    def _binary_search_nb(arr, target):
+        # Branchless lower bound: the comparison result is used as a 0/1
+        # multiplier instead of an if/else, so LLVM can emit a conditional
+        # move and the CPU has no data dependent branch to mispredict
+        n = arr.shape[0]
+        if n == 0:
+            return -1
+
+        base = 0
+        length = n
+        while length > 1:
+            half = length//2
+            base += half * (arr[base + half - 1] < target)
+            length -= half
+
+        index = base + (arr[base] < target)
+        if index < n and arr[index] == target:
+            return index
+        return -1 # numba prefers a single return type, -1 means not found
+
+    def binary_search_nb(arr, target):
+        """ 
+        Same as binary_search, compiled to native code by numba.
+        Expects a sorted int64 NumPy array.
+        """
+        index = _binary_search_nb(arr, target)
+        return index if index != -1 else None
+else:
+    # numba not installed, fall back to the pure Python version
+    binary_search_nb = binary_search
+
+if np is not None:
+    def binary_search_batch(sorted_arr, targets):
+        """ 
+        Searches many targets at once with np.searchsorted.
+        Returns an array with the index of each target, or -1 if not found.
+        O((N + M) log N) in C instead of M separate Python calls
+        """
+        sorted_arr = np.asarray(sorted_arr)
+        targets = np.asarray(targets)
+        n = len(sorted_arr)
+        if n == 0:
+            return np.full(targets.shape, -1)
+
+        index = np.searchsorted(sorted_arr, targets)
+        # searchsorted returns n for targets past the end, clip before reading
+        found = (index < n) & (sorted_arr[np.clip(index, 0, n - 1)] == targets)
+        return np.where(found, index, -1)
+
 def verify(index):
     if index is not None:
         print(f'Target found at index {index}!')
@@ -35,4 +97,13 @@ my_target = 12
 
 result = binary_search(my_list, my_target)
 
-verify(result)
\ No newline at end of file
+verify(result)
+
+if np is not None:
+    my_array = np.arange(0, 100, dtype=np.int64)
+
+    result = binary_search_nb(my_array, my_target)
+
+    verify(result)
+
+    print(binary_search_batch(my_array, [0, 12, 99, 100]))
\ No newline at end of file
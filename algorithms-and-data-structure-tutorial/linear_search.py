@@ -1,8 +1,60 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Below this size the NumPy call overhead costs more than the Python loop
+NUMPY_MIN_SIZE = 64
+
+
+def _as_numeric_array(list, target):
+    """ 
+    Returns list as a 1-D numeric NumPy array when comparing it with target
+    in NumPy gives the same answer as the Python loop, else returns None
+    """
+    if isinstance(target, (int, np.integer, np.bool_)):
+        target_kinds = 'biu'
+    elif isinstance(target, (float, np.floating)):
+        target_kinds = 'f'
+    else:
+        return None # tuples, strings, ... are compared element by element in Python
+
+    if isinstance(list, np.ndarray):
+        arr = list
+    else:
+        try:
+            arr = np.asarray(list)
+        except ValueError: # ragged nested lists
+            return None
+        # Mixed lists get converted (ints to float64, numbers to strings),
+        # so only trust the array when its kind matches the target's kind
+        if arr.dtype.kind not in target_kinds:
+            return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in 'biuf':
+        return None
+
+    return arr
+
+
 def linear_search(list, target):
     """ 
     If found returns the index position of the target, else returns None
     """
     
+    if np is not None and len(list) >= NUMPY_MIN_SIZE:
+        arr = _as_numeric_array(list, target)
+        if arr is not None:
+            # Compare every element in C and let argmax find the first match
+            mask = arr == target
+            index = int(np.argmax(mask))
+            return index if mask[index] else None
     
     for i in range(0, len(list)):
         if list[i] == target:
@@ -11,6 +63,26 @@ def linear_search(list, target):
     
     return None
 
+if njit is not None:
+    @njit(cache=True) # cache=True reuses the compiled code between runs
+    def _linear_search_nb(arr, target):
+        for i in range(arr.shape[0]):
+            if arr[i] == target:
+                return i
+
+        return -1 # numba prefers a single return type, -1 means not found
+
+    def linear_search_nb(arr, target):
+        """ 
+        Same as linear_search, compiled to native code by numba.
+        Expects an int64 NumPy array.
+        """
+        index = _linear_search_nb(arr, target)
+        return index if index != -1 else None
+else:
+    # numba not installed, fall back to the pure Python version
+    linear_search_nb = linear_search
+
 def verify(index):
     if index is not None:
         print(f'Target found at index {index}!')
@@ -22,4 +94,11 @@ my_target = 100
 
 result = linear_search(my_list, my_target)
 
-verify(result)
\ No newline at end of file
+verify(result)
+
+if np is not None:
+    my_array = np.arange(0, 100, dtype=np.int64)
+
+    result = linear_search_nb(my_array, my_target)
+
+    verify(result)
\ No newline at end of file
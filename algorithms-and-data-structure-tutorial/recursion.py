@@ -1,28 +1,27 @@
-def my_sum(arr):
-    if len(arr) == 0:
+def my_sum(arr, i=0):
+    if i == len(arr):
         return 0
     else:
-        return arr.pop(0) + my_sum(arr)
+        return arr[i] + my_sum(arr, i+1)
         
 print(my_sum([2, 3, 4]))
 
 
-def my_count(arr):
-    if arr == []:
+def my_count(arr, i=0):
+    if i == len(arr):
         return 0
     else:
-        arr.pop()
-        return 1 + my_count(arr)
+        return 1 + my_count(arr, i+1)
         
 print(my_count([2, 3, 4, 5, 9]))
 
-def my_max(arr):
-    if len(arr) == 1:  # base case
-        return arr[0]
+def my_max(arr, i=0):
+    if i == len(arr) - 1:  # base case
+        return arr[i]
     else:
-        sub_max = my_max(arr[1:])  # recursive call
-        if arr[0] > sub_max:
-            return arr[0]
+        sub_max = my_max(arr, i+1)  # recursive call
+        if arr[i] > sub_max:
+            return arr[i]
         else:
             return sub_max
 
@@ -1,16 +1,21 @@
-def recursive_binary_search(list, target):
-    if len(list) == 0:
+def recursive_binary_search(list, target, first=0, last=None):
+    # Recurse on the [first, last] index range instead of slicing the list,
+    # so no sublist copies are made on each call
+    if last is None:
+        last = len(list) - 1
+
+    if first > last:
         return False
     else:
-        midpoint = (len(list)//2)
+        midpoint = (first + last)//2
         
         if list[midpoint] == target:
             return True
         else:
             if list[midpoint] < target:
-                return recursive_binary_search(list[midpoint+1:], target)
+                return recursive_binary_search(list, target, midpoint + 1, last)
             else:
-                return recursive_binary_search(list[:midpoint], target)
+                return recursive_binary_search(list, target, first, midpoint - 1)
 
 def verify(result):
     if result:
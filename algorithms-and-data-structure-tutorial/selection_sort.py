@@ -1,20 +1,20 @@
-def search_min_value(array):
-    min_value = array[0]
-    min_indice = 0
+def search_min_value(array, start=0):
+    min_value = array[start]
+    min_indice = start
 
-    for i in range(1, len(array)): # skip the 0 indice
+    for i in range(start + 1, len(array)): # skip the start indice
         if array[i] < min_value:
             min_value = array[i]
             min_indice = i
     return min_indice
 
 def selection_sort(array):
-    new_array = []
     for i in range(len(array)):
-        min_value = search_min_value(array)
-        new_array.append(array.pop(min_value))
+        # only search the unsorted part [i, n) and swap in place
+        min_indice = search_min_value(array, i)
+        array[i], array[min_indice] = array[min_indice], array[i]
     
-    return new_array
+    return array
 
 print(selection_sort([5, 3, 6, 2, 10]))
         
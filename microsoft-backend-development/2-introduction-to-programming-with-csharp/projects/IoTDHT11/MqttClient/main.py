@@ -3,6 +3,12 @@ import time
 import paho.mqtt.client as mqtt
 import random
 import math
+import threading
+
+try:
+    import orjson  # faster serializer, optional
+except ImportError:
+    orjson = None
 
 # MQTT broker configuration
 BROKER = "localhost"
@@ -12,6 +18,49 @@ TOPIC = "iot/sensors/data"
 # MQTT client instance (initialized later)
 client = None
 connected = False
+# Set by on_connect once the broker answers the connection request
+connected_event = threading.Event()
+
+# Payload template built once and reused, only the readings change per message
+_PAYLOAD = {
+    "DeviceId": "esp32-01",
+    "TemperatureC": 0.0,
+    "Humidity": 0.0,
+    "Timestamp": ""
+}
+
+
+# Last formatted timestamp, reused while messages are sent within the same second
+_last_ts_second = None
+_last_ts = ""
+
+
+def _timestamp(t):
+    global _last_ts_second, _last_ts
+    second = int(t)
+    if second != _last_ts_second:
+        _last_ts_second = second
+        _last_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+    return _last_ts
+
+
+def _dumps(data):
+    # Both paths return bytes, which client.publish() accepts directly
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def on_connect(client, userdata, flags, rc):
+    global connected
+    connected = rc == 0
+    connected_event.set()
+
+
+def on_disconnect(client, userdata, rc):
+    global connected
+    connected = False
+
 
 def connect_broker():
     global client, connected
@@ -20,14 +69,23 @@ def connect_broker():
         return
 
     client = mqtt.Client(client_id="MenuPublisher", protocol=mqtt.MQTTv311)
+    client.on_connect = on_connect
+    client.on_disconnect = on_disconnect
+    connected_event.clear()
     try:
         client.connect(BROKER, PORT, keepalive=60)
         client.loop_start()  # starts background network loop
-        time.sleep(1)  # wait a moment to ensure connection is established
-        connected = client.is_connected()
+        # wait only until the broker acknowledges the connection (or timeout)
+        if not connected_event.wait(timeout=5):
+            connected = False
         if connected:
             print("✅ Connected to MQTT broker")
         else:         
+            # Tear the client down fully, so send_message asks to connect again
+            # instead of publishing on a client without a network loop
+            client.disconnect()
+            client.loop_stop()
+            client = None
             print("❌ Connection failed")
         
     except Exception as e:
@@ -55,37 +113,75 @@ def send_message():
             connected = False
             return
 
+    publish_reading()
+
+
+def publish_reading():
     # Prepare sample sensor data with larger deviations and spikes
     base_temp = 25
     base_humidity = 50
     # Using sine + random spikes
     temp_spike = random.choice([0, 10, 15])  # occasional big spikes
     hum_spike = random.choice([0, 15, 20])
-    sensor_data = {
-        "DeviceId": "esp32-01",
-        "TemperatureC": round(base_temp + 10 * math.sin(time.time()) + temp_spike, 2),
-        "Humidity": round(base_humidity + 10 * math.cos(time.time()) + hum_spike, 2),
-        "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    }
+    t = time.time()
+    _PAYLOAD["TemperatureC"] = round(base_temp + 10 * math.sin(t) + temp_spike, 2)
+    _PAYLOAD["Humidity"] = round(base_humidity + 10 * math.cos(t) + hum_spike, 2)
+    _PAYLOAD["Timestamp"] = _timestamp(t)
 
-    payload = json.dumps(sensor_data)
+    payload = _dumps(_PAYLOAD)
 
     # Publish the message
     result = client.publish(TOPIC, payload, qos=1)
     if result.rc == mqtt.MQTT_ERR_SUCCESS:
-        print(f"✅ Published: {payload}")
+        print(f"✅ Published: {payload.decode()}")
     else:
         print("❌ Failed to publish message")
 
 
 def send_messages_auto(interval=1):
     print("🚀 Sending messages automatically. Press Ctrl+C to stop.")
+    stop_event = threading.Event()
+    # Scheduled against a fixed clock so publish time does not add drift
+    next_send = time.monotonic()
+
+    def publish_tick():
+        nonlocal next_send, timer
+        if stop_event.is_set():
+            return
+        if client.is_connected():
+            publish_reading()
+        else:
+            print("⚠️ Connection lost. Skipping this message.")
+        # Ticks missed while stalled are skipped instead of sent in a burst
+        next_send = max(next_send + interval, time.monotonic())
+        if not stop_event.is_set():
+            timer = threading.Timer(next_send - time.monotonic(), publish_tick)
+            timer.daemon = True
+            timer.start()
+
+    # The network loop moves from its background thread to the main thread,
+    # which now waits on the socket instead of sleeping between messages.
+    # loop_forever() can't be used here: after loop_stop() it returns as soon
+    # as nothing is queued, so client.loop() is called directly instead.
+    client.loop_stop()
+    timer = threading.Timer(0, publish_tick)
+    timer.daemon = True
+    timer.start()
     try:
         while True:
-            send_message()
-            time.sleep(interval)
+            if client.loop(timeout=1.0) != mqtt.MQTT_ERR_SUCCESS:
+                print("⚠️ Connection lost. Reconnecting...")
+                time.sleep(1)  # pause between attempts while the broker is down
+                try:
+                    client.reconnect()
+                except Exception as e:
+                    print(f"❌ Failed to reconnect: {e}")
     except KeyboardInterrupt:
         print("\n⏹️ Automatic sending stopped by user.")
+    finally:
+        stop_event.set()
+        timer.cancel()
+        client.loop_start()  # hand the network loop back to a background thread
 
 def disconnect_broker():
     global client, connected
@@ -1,24 +1,45 @@
+import csv
 import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 
+# Fixed set of entry types, stored as small integer codes instead of strings
+ENTRY_TYPES = pd.CategoricalDtype(['FIXED_COST', 'VARIABLE_COST', 'INCOME'])
+
+# Pie chart labels and colors for the cost types
+COST_TYPE_LABELS = {'FIXED_COST': 'Fixed Cost', 'VARIABLE_COST': 'Variable Cost'}
+COST_TYPE_COLORS = {'FIXED_COST': '#FF9999', 'VARIABLE_COST': '#66B3FF'}
+
+# Descriptions below this share of total costs are grouped into "Other"
+MIN_SLICE_SHARE = 0.01
+
+
 # =======================================
 #              UTILITIES
 # =======================================
 
-def parse_decimal(s):
-    """Convert string with comma or dot decimal separator to float."""
-    if pd.isna(s):
-        return 0.0
-    if isinstance(s, (int, float)):
-        return float(s)
-    s = str(s).replace(',', '.').strip()
+def parse_decimal_column(values: pd.Series) -> pd.Series:
+    """Convert a column with comma or dot decimal separator to floats (invalid -> 0.0)."""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(str).str.replace(',', '.', regex=False).str.strip()
+    return pd.to_numeric(values, errors='coerce').fillna(0.0).astype(float)
+
+
+def parse_entry_types(values: pd.Series) -> pd.Series:
+    """Normalize TYPE values to the ENTRY_TYPES categorical (blank or unknown -> NaN)."""
+    return values.astype(str).str.strip().str.upper().astype(ENTRY_TYPES)
+
+
+def detect_separator(filepath: str, default: str = ',') -> str:
+    """Sniff the CSV separator once from the start of the file."""
+    with open(filepath, newline='', encoding='utf-8') as f:
+        sample = f.read(4096)
     try:
-        return float(s)
-    except ValueError:
-        return 0.0
+        return csv.Sniffer().sniff(sample, delimiters=',;\t').delimiter
+    except csv.Error:
+        return default
 
 
 # =======================================
@@ -27,7 +48,7 @@ def parse_decimal(s):
 
 def load_data(filepath: str = "ledger.csv") -> pd.DataFrame:
     """Load ledger data and normalize columns."""
-    df = pd.read_csv(filepath, sep=None, engine="python")  # Auto-detect separator
+    df = pd.read_csv(filepath, sep=detect_separator(filepath))  # Fast C engine
     df.columns = df.columns.str.strip().str.upper()  # Normalize header names
 
     expected_cols = ['MONTH', 'TYPE', 'DESCRIPTION', 'VALUE', 'DATE']
@@ -35,10 +56,17 @@ def load_data(filepath: str = "ledger.csv") -> pd.DataFrame:
     if missing_cols:
         raise ValueError(f"❌ Missing expected columns: {missing_cols}")
 
-    df['VALUE'] = df['VALUE'].apply(parse_decimal)
+    df['VALUE'] = parse_decimal_column(df['VALUE'])
     df['DATE'] = pd.to_datetime(df['DATE'], errors='coerce')
     df['MONTH'] = pd.to_datetime(df['MONTH'], errors='coerce')
     df = df.dropna(subset=['DATE', 'MONTH'])
+
+    # Rows with a blank or unknown TYPE are skipped instead of failing the whole load
+    df['TYPE'] = parse_entry_types(df['TYPE'])
+    unknown_types = df['TYPE'].isna()
+    if unknown_types.any():
+        print(f"⚠️ Skipping {unknown_types.sum()} row(s) with an unknown entry type.")
+        df = df[~unknown_types]
     return df
 
 
@@ -49,14 +77,11 @@ def load_data(filepath: str = "ledger.csv") -> pd.DataFrame:
 def aggregate_monthly(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate ledger entries per month and compute totals."""
     df['MONTH'] = df['DATE'].dt.to_period('M').dt.to_timestamp()
-    df_agg = df.groupby(['MONTH', 'TYPE'])['VALUE'].sum().unstack(fill_value=0)
-
-    # Ensure all relevant columns exist
-    for col in ['FIXED_COST', 'VARIABLE_COST', 'INCOME']:
-        if col not in df_agg.columns:
-            df_agg[col] = 0.0
+    # Categorical TYPE with observed=False guarantees a column for every entry type
+    df_agg = df.pivot_table(index='MONTH', columns='TYPE', values='VALUE',
+                            aggfunc='sum', fill_value=0, observed=False)
 
-    df_agg['TOTAL_EXPENSES'] = df_agg['FIXED_COST'] + df_agg['VARIABLE_COST']
+    df_agg['TOTAL_EXPENSES'] = df_agg[['FIXED_COST', 'VARIABLE_COST']].sum(axis=1)
     df_agg = df_agg.reset_index()
     return df_agg
 
@@ -64,8 +89,10 @@ def aggregate_monthly(df: pd.DataFrame) -> pd.DataFrame:
 def calculate_equilibrium(df_agg: pd.DataFrame) -> pd.DataFrame:
     """Compute cumulative income and expenses to identify financial equilibrium."""
     df_agg = df_agg.copy()
-    df_agg['CUM_NET_INCOME'] = df_agg['INCOME'].cumsum() - df_agg['TOTAL_EXPENSES'].cumsum()
-    df_agg['CUM_FUTURE_EXPENSES'] = df_agg['TOTAL_EXPENSES'][::-1].cumsum()[::-1]
+    cum_expenses = df_agg['TOTAL_EXPENSES'].cumsum()
+    df_agg['CUM_NET_INCOME'] = df_agg['INCOME'].cumsum() - cum_expenses
+    # Expenses from this month to the end = total - expenses before this month
+    df_agg['CUM_FUTURE_EXPENSES'] = cum_expenses.iloc[-1] - cum_expenses + df_agg['TOTAL_EXPENSES']
     df_agg['EQUILIBRIUM_BALANCE'] = df_agg['CUM_NET_INCOME'] - df_agg['CUM_FUTURE_EXPENSES']
     return df_agg
 
@@ -123,21 +150,30 @@ def plot_cost_distribution(df: pd.DataFrame):
     cost_df = df[df['TYPE'].isin(['FIXED_COST', 'VARIABLE_COST'])]
 
     # 1️⃣ Aggregate totals by TYPE (Fixed vs Variable)
-    type_sums = cost_df.groupby('TYPE')['VALUE'].sum().reindex(['FIXED_COST', 'VARIABLE_COST']).fillna(0)
+    type_sums = cost_df.groupby('TYPE', observed=True)['VALUE'].sum().reindex(['FIXED_COST', 'VARIABLE_COST']).fillna(0)
 
     # 2️⃣ Aggregate totals by DESCRIPTION (individual cost items)
     desc_sums = cost_df.groupby('DESCRIPTION')['VALUE'].sum().sort_values(ascending=False)
 
+    # Zero-valued slices are invisible, skip them instead of drawing them
+    type_sums = type_sums[type_sums > 0]
+    desc_sums = desc_sums[desc_sums > 0]
+
+    # Group the long tail of tiny slices into a single "Other" slice
+    small = desc_sums < desc_sums.sum() * MIN_SLICE_SHARE
+    if small.sum() > 1:
+        desc_sums = pd.concat([desc_sums[~small], pd.Series({'Other': desc_sums[small].sum()})])
+
     # ----- Plot side-by-side pies -----
     fig, axes = plt.subplots(1, 2, figsize=(14, 7))
 
     # Pie 1: Fixed vs Variable Costs
     axes[0].pie(
         type_sums,
-        labels=type_sums.index.str.replace('_', ' ').str.title(),
+        labels=type_sums.index.map(COST_TYPE_LABELS),
         autopct='%1.1f%%',
         startangle=90,
-        colors=['#FF9999', '#66B3FF']
+        colors=[COST_TYPE_COLORS[t] for t in type_sums.index]
     )
     axes[0].set_title('Fixed vs Variable Costs')
 
@@ -160,7 +196,11 @@ def plot_cost_distribution(df: pd.DataFrame):
 #               DATA ENTRY
 # =======================================
 
-def add_entry(df: pd.DataFrame, entry_type: str):
+# Entries added during the session, merged into the ledger only when it is needed
+_pending_entries = []
+
+
+def add_entry(entry_type: str):
     """Add a new ledger entry interactively, supporting repetition."""
     try:
         description = input("Enter a short description: ").strip()
@@ -171,13 +211,12 @@ def add_entry(df: pd.DataFrame, entry_type: str):
         date = datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
         print("❌ Invalid input. Entry not added.")
-        return df
+        return
 
     # Generate repeated monthly entries
-    entries = []
     for i in range(repeat_times):
         entry_date = date + relativedelta(months=i)
-        entries.append({
+        _pending_entries.append({
             'MONTH': entry_date.replace(day=1),
             'TYPE': entry_type,
             'DESCRIPTION': description,
@@ -185,9 +224,17 @@ def add_entry(df: pd.DataFrame, entry_type: str):
             'DATE': entry_date
         })
 
-    new_rows = pd.DataFrame(entries)
-    df = pd.concat([df, new_rows], ignore_index=True)
     print(f"✅ Added {repeat_times} entry(ies) for {entry_type.replace('_', ' ').capitalize()}.")
+
+
+def merge_pending_entries(df: pd.DataFrame) -> pd.DataFrame:
+    """Append all pending entries to the ledger with a single concat."""
+    if not _pending_entries:
+        return df
+    new_rows = pd.DataFrame(_pending_entries)
+    _pending_entries.clear()
+    df = pd.concat([df, new_rows], ignore_index=True)
+    df['TYPE'] = parse_entry_types(df['TYPE'])
     return df
 
 
@@ -225,12 +272,13 @@ def main():
         choice = input("Select an option: ").strip()
 
         if choice == "1":
-            df = add_entry(df, "FIXED_COST")
+            add_entry("FIXED_COST")
         elif choice == "2":
-            df = add_entry(df, "VARIABLE_COST")
+            add_entry("VARIABLE_COST")
         elif choice == "3":
-            df = add_entry(df, "INCOME")
+            add_entry("INCOME")
         elif choice == "4":
+            df = merge_pending_entries(df)
             if df.empty:
                 print("⚠️ No data to process.")
                 continue
@@ -239,11 +287,13 @@ def main():
             display_projection_table(df_agg)
             plot_projection(df_agg)
         elif choice == "5":
+            df = merge_pending_entries(df)
             if df.empty:
                 print("⚠️ No data to process.")
                 continue
             plot_cost_distribution(df)
         elif choice == "6":
+            df = merge_pending_entries(df)
             df.to_csv("ledger.csv", sep=',', index=False)
             print("💾 Ledger saved.")
         elif choice == "7":
@@ -83,7 +83,7 @@ class HumanPlayer(Player):
             square = input(f'Your turn. Input move (0-{game.get_rows()*game.get_cols()-1}):\n')
             try:
                 move = int(square)  # Try to parse the input
-                if move not in game.available_moves():
+                if not game.is_available(move):
                     raise ValueError  # Invalid if square is occupied or out of bounds
                 valid_square = True  # Valid move
             except ValueError:
@@ -98,6 +98,8 @@ class GeniusComputerPlayer(Player):
     Attributes:
         letter (str): The letter assigned to this player ('x' or 'o').
         adversary (str): The letter representing the opponent player.
+        transposition_table (dict): Minimax results already computed,
+            keyed by (game.state_key(), player to move).
     """
 
     def __init__(self, letter, adversary):
@@ -109,6 +111,7 @@ class GeniusComputerPlayer(Player):
             adversary (str): The opposing player’s letter.
         """
         self.adversary = adversary
+        self.transposition_table = {}
         super().__init__(letter)
 
     def get_move(self, game):
@@ -146,6 +149,12 @@ class GeniusComputerPlayer(Player):
                   - 'position' (int): The best move index.
                   - 'score' (int): The evaluated score for the move.
         """
+        # Positions reached through different move orders are only searched once
+        key = (game.state_key(), player)
+        cached = self.transposition_table.get(key)
+        if cached is not None:
+            return dict(cached)  # Copy, the caller overwrites 'position'
+
         me = self.letter
         adversary = self.adversary if player == me else me
 
@@ -176,8 +185,7 @@ class GeniusComputerPlayer(Player):
             sim_score = self.minimax(game, adversary)
 
             # Undo the move (backtracking)
-            game.board[possible_move] = ' '
-            game.current_winner = None
+            game.undo_move(possible_move)
             sim_score['position'] = possible_move
 
             # Update the best move based on the player's goal (max or min)
@@ -188,4 +196,5 @@ class GeniusComputerPlayer(Player):
                 if sim_score['score'] < best['score']:
                     best = sim_score
 
+        self.transposition_table[key] = dict(best)
         return best
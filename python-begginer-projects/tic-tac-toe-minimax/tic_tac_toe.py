@@ -1,3 +1,13 @@
+def _lines_through(win_masks, total_cells):
+    """
+    Builds a lookup table: for each square, the winning line masks that pass through it.
+    """
+    return tuple(
+        tuple(mask for mask in win_masks if mask >> square & 1)
+        for square in range(total_cells)
+    )
+
+
 class TicTacToe:
     """
     A class to represent the game logic for a classic 3x3 Tic Tac Toe game.
@@ -9,24 +19,46 @@ class TicTacToe:
     ROWS = 3
     COLS = 3
     TOTAL_CELLS = ROWS * COLS  # Total number of squares on the board
+    FULL_BOARD = (1 << TOTAL_CELLS) - 1  # All 9 bits set
+
+    # Bitmasks of the 8 winning lines, bit i is square i.
+    # In octal each digit is one row (lowest digit = top row): 3 rows, 3 columns, 2 diagonals.
+    WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+    # Only the 2-4 lines through the last move can have been completed by it
+    LINES_THROUGH = _lines_through(WIN_MASKS, TOTAL_CELLS)
 
     def __init__(self):
         """
         Initializes the game board and sets the winner to None.
-        The board is represented as a flat list of 9 strings.
+        The board is represented as two 9-bit integers (bitboards), one per player,
+        plus their union with every occupied square.
         """
-        self.board = [' ' for _ in range(self.TOTAL_CELLS)]  # 3x3 board initialized with empty spaces
+        self.x_bb = 0  # Squares taken by 'x'
+        self.o_bb = 0  # Squares taken by 'o'
+        self.occ_bb = 0  # Squares taken by anyone
+        self._num_empty = self.TOTAL_CELLS  # Kept up to date by make_move/undo_move
         self.current_winner = None  # Will store the letter of the winner when the game ends
 
+    def get_cell(self, square):
+        """
+        Returns the letter at the given square, or ' ' if it is empty.
+        """
+        bit = 1 << square
+        if self.x_bb & bit:
+            return 'x'
+        if self.o_bb & bit:
+            return 'o'
+        return ' '
+
     def print_board(self):
         """
         Prints the current state of the game board in a human-readable format.
-        Each row is sliced out of the flat board list using calculated indices.
+        Each row is read out of the bitboards using calculated indices.
         """
         for row_index in range(self.ROWS):
             start = row_index * self.COLS
             end = start + self.COLS
-            row = self.board[start:end]
+            row = [self.get_cell(square) for square in range(start, end)]
             print('| ' + ' | '.join(row) + ' |')
             
     def get_rows(self):
@@ -50,24 +82,76 @@ class TicTacToe:
         for row in number_board:
             print('| ' + ' | '.join(row) + ' |')
 
+    def state_key(self):
+        """
+        Returns the whole position packed into one 18-bit integer:
+        the 'x' bitboard in the high 9 bits and the 'o' bitboard in the low 9 bits.
+
+        Being a small int, it is a cheap dictionary key, so a search can memoize
+        positions it has already evaluated (a transposition table), e.g. with
+        functools.lru_cache on a function taking (state_key, player).
+        """
+        return (self.x_bb << self.TOTAL_CELLS) | self.o_bb
+
+    @classmethod
+    def from_key(cls, key):
+        """
+        Rebuilds a game from a value returned by state_key().
+
+        Args:
+            key (int): The packed position.
+
+        Returns:
+            TicTacToe: A new game in that position, with current_winner set if a line is complete.
+
+        Raises:
+            ValueError: If the key is negative, too large, or puts x and o on the same square.
+        """
+        x_bb = key >> cls.TOTAL_CELLS
+        o_bb = key & cls.FULL_BOARD
+        # A valid key fits in 18 bits and never has a square taken by both players
+        if key >> (2 * cls.TOTAL_CELLS) or x_bb & o_bb:
+            raise ValueError(f"Invalid board key: {key}")
+        game = cls()
+        game.x_bb = x_bb
+        game.o_bb = o_bb
+        game.occ_bb = game.x_bb | game.o_bb
+        game._num_empty = cls.TOTAL_CELLS - game.occ_bb.bit_count()
+        for letter, player_bb in (('x', game.x_bb), ('o', game.o_bb)):
+            if any(player_bb & mask == mask for mask in cls.WIN_MASKS):
+                game.current_winner = letter
+        return game
+
     def available_moves(self):
         """
         Returns a list of indices where a player can make a move (i.e., empty squares).
+        Walks the set bits of the free-squares mask, lowest first.
+        """
+        moves = []
+        free = ~self.occ_bb & self.FULL_BOARD
+        while free:
+            lowest = free & -free  # Isolate the lowest set bit
+            moves.append(lowest.bit_length() - 1)
+            free ^= lowest
+        return moves
+
+    def is_available(self, square):
+        """
+        Returns True if the square is on the board and still empty.
         """
-        return [i for i, spot in enumerate(self.board) if spot == ' ']
+        return 0 <= square < self.TOTAL_CELLS and not self.occ_bb & (1 << square)
 
     def empty_squares(self):
         """
         Returns True if there are any empty squares on the board.
-        Uses available_moves for logic reuse.
         """
-        return bool(self.available_moves())
+        return self._num_empty > 0
 
     def num_empty_squares(self):
         """
         Returns the number of empty squares remaining on the board.
         """
-        return len(self.available_moves())
+        return self._num_empty
 
     def make_move(self, square, letter):
         """
@@ -81,21 +165,45 @@ class TicTacToe:
         Returns:
             bool: True if the move is valid and made successfully, False otherwise.
         """
-        if square in self.available_moves():
-            self.board[square] = letter
-            if self.check_winner(square, letter):
-                self.current_winner = letter
-            return True
-        return False
+        if not self.is_available(square):
+            return False
+
+        bit = 1 << square
+        if letter == 'x':
+            self.x_bb |= bit
+        else:
+            self.o_bb |= bit
+        self.occ_bb |= bit
+        self._num_empty -= 1
+
+        if self.check_winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def undo_move(self, square):
+        """
+        Clears the given square and resets the winner.
+        Used to backtrack after simulating a move.
+
+        Args:
+            square (int): The index on the board (0-8) to clear.
+        """
+        bit = 1 << square
+        if not self.occ_bb & bit:
+            return
+        clear = ~bit
+        self.x_bb &= clear
+        self.o_bb &= clear
+        self.occ_bb &= clear
+        self._num_empty += 1
+        self.current_winner = None
 
     def check_winner(self, square, letter):
         """
         Checks if placing the given letter on the square results in a win.
 
-        A win is determined by checking:
-        - The row containing the square
-        - The column containing the square
-        - Both diagonals (if applicable)
+        A win is determined by checking whether the player's bitboard
+        covers every square of one of the winning lines through the square.
 
         Args:
             square (int): The index where the last move was made.
@@ -104,29 +212,8 @@ class TicTacToe:
         Returns:
             bool: True if the player wins with this move, False otherwise.
         """
-        # Check row
-        row_index = square // self.ROWS
-        row_start = row_index * self.ROWS
-        row = self.board[row_start : row_start + self.ROWS]
-        if all([spot == letter for spot in row]):
-            return True
-
-        # Check column
-        col_index = square % self.COLS
-        column = [self.board[col_index + i * self.COLS] for i in range(self.ROWS)]
-        if all([spot == letter for spot in column]):
-            return True
-
-        # Check diagonals (only if the square is an even index)
-        if square % 2 == 0:
-            # Left-to-right diagonal
-            diagonal1 = [self.board[i] for i in [0, 4, 8]]
-            if all([spot == letter for spot in diagonal1]):
-                return True
-
-            # Right-to-left diagonal
-            diagonal2 = [self.board[i] for i in [2, 4, 6]]
-            if all([spot == letter for spot in diagonal2]):
+        player_bb = self.x_bb if letter == 'x' else self.o_bb
+        for mask in self.LINES_THROUGH[square]:
+            if player_bb & mask == mask:
                 return True
-
         return False
@@ -70,7 +70,7 @@ class HumanPlayer(Player):
             square = input('Your turn. Input move (0-8):\n')
             try:
                 move = int(square)  # Try to parse the input
-                if move not in game.available_moves():
+                if not game.is_available(move):
                     raise ValueError  # Invalid if square is occupied or out of bounds
                 valid_square = True  # Valid move
             except ValueError:
@@ -119,6 +119,8 @@ import pygame
 import sys
 from pygame.locals import *
 import random
+from collections import deque
+from functools import lru_cache
 
 pygame.init()
 
@@ -142,7 +144,8 @@ WHITE = (255, 255, 255)  # RGB color for white
 RESOURCES_PATH = "D:/workspace/System-Design-and-Api-dev-roadmap/python-tutorial-for-beginners/resources/"
 
 # Load the cat image that the player controls
-catImg = pygame.image.load(RESOURCES_PATH + "cat.png")
+# convert_alpha() converts it once to the screen's pixel format, so blitting it every frame is fast
+catImg = pygame.image.load(RESOURCES_PATH + "cat.png").convert_alpha()
 
 # Randomly place the cat somewhere on the screen initially
 catx = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)  # Integer position on X-axis
@@ -170,19 +173,29 @@ PREYS = [
     RESOURCES_PATH + "lizard.png"
 ]
 
-# List of the cat's hitbox corner points (each point is [x, y])
-cat_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
+# Load every prey image once at startup as (name, converted surface) pairs,
+# so catching a prey doesn't read, decode or parse a file path inside the game loop
+# The name is the file name without folder and extension (like "rat" or "spider")
+prey_items = [
+    (path.rsplit("/", 1)[-1].rsplit(".", 1)[0], pygame.image.load(path).convert_alpha())
+    for path in PREYS
+]
+
+# The cat's hitbox as a pygame.Rect (x, y, width, height), recalculated only when the cat moves
+cat_rect = pygame.Rect(0, 0, 0, 0)
+cat_moved = True  # True on the first frame so the hitbox gets calculated once
 
 PREY_HIT_BOX_X_SIZE = 48.0
 PREY_HIT_BOX_Y_SIZE = 48.0
 PREY_HIT_BOX_X_OFFSET = 24
 PREY_HIT_BOX_Y_OFFSET = 24
 
-# List to keep the last 3 caught prey names (history)
-prey_history = []
+# Keeps the last 3 caught prey names (history), a deque drops the oldest automatically
+prey_history = deque(maxlen=3)
 
-# List to keep track of cat's previous positions for undo feature
-movement_history = []
+# Keeps the cat's last 256 positions for "undo" movement, older ones are dropped
+# so the history doesn't keep growing during a long game
+movement_history = deque(maxlen=256)
 
 # List to keep scores of this game session (like a leaderboard)
 score_log = []
@@ -193,14 +206,28 @@ caught_prey_positions = []
 # List for special rewards earned during the game
 special_rewards = []
 
-# List to log frame timestamps (used to track time in the game)
-frame_timeline = []
+# Logs the last 100 frame timestamps (used to track time in the game)
+frame_timeline = deque(maxlen=100)
 
 score = 0  # Player's score (integer)
 
 # Font to display text on screen
 font = pygame.font.Font(None, 36)
 
+
+# Rendering text is slow, so each (text, color) surface is rendered once and reused.
+# maxsize keeps memory bounded when texts keep changing (like the score).
+@lru_cache(maxsize=256)
+def get_label(text, color=(50, 50, 50)):
+    return font.render(text, True, color)
+
+
+# These list labels never change, so they are rendered once before the game loop
+static_list_labels = [
+    get_label("Active Lists:"),
+    get_label(f"- PREYS: {len(PREYS)} items")  # Number of prey types (int)
+]
+
 # -----------------------------------------
 # Main game loop starts here
 # -----------------------------------------
@@ -208,9 +235,8 @@ while True:
     DISPLAYSURF.fill(WHITE)  # Clear screen with white color (tuple)
 
     # Keep track of frame timestamps using pygame's get_ticks (returns int milliseconds)
+    # maxlen=100 keeps only the last 100 timestamps, removing the oldest in O(1)
     frame_timeline.append(pygame.time.get_ticks())
-    if len(frame_timeline) > 100:  # Keep only the last 100 timestamps to save memory
-        frame_timeline.pop(0)  # Remove the oldest timestamp from the list
 
     for event in pygame.event.get():
         if event.type == QUIT:
@@ -221,117 +247,81 @@ while True:
             pygame.quit()
             sys.exit()
 
+        # Single key presses: undo and debug print (read straight from the event)
         if event.type == KEYDOWN:
-            keys = pygame.key.get_pressed()
-
-            # Movement keys: store previous position in a list before moving (undo feature)
-            if keys[K_RIGHT]:
-                movement_history.append((catx, caty))  # Save previous position (tuple)
-                catx += 10
-                if catx >= RIGHT_EDGE_MAX:
-                    catx -= 10
-            elif keys[K_DOWN]:
-                movement_history.append((catx, caty))
-                caty += 10
-                if caty >= BOTTOM_EDGE_MAX:
-                    caty -= 10
-            elif keys[K_LEFT]:
-                movement_history.append((catx, caty))
-                catx -= 10
-                if catx <= LEFT_EDGE_MAX:
-                    catx += 10
-            elif keys[K_UP]:
-                movement_history.append((catx, caty))
-                caty -= 10
-                if caty <= TOP_EDGE_MAX:
-                    caty += 10
-            elif keys[K_u]:  # Undo last movement if possible
+            if event.key == K_u:  # Undo last movement if possible
                 if movement_history:
                     catx, caty = movement_history.pop()  # Pop last position tuple from list
-            elif keys[K_c]:
-                print(cat_hit_box)  # Debug print hitbox coordinates
-
-    # Update the cat's hitbox coordinates based on the current cat position (using floats)
-    cat_hit_box[0][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[0][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[1][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[1][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[2][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[2][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[3][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[3][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
+                    cat_moved = True
+            elif event.key == K_c:
+                print(cat_rect)  # Debug print hitbox rectangle
+
+    # Movement keys are polled once per frame, so holding a key keeps the cat moving
+    keys = pygame.key.get_pressed()
+    dx = (keys[K_RIGHT] - keys[K_LEFT]) * 10
+    dy = (keys[K_DOWN] - keys[K_UP]) * 10
+    if dx or dy:
+        # Clamp the new position so the cat stays between the screen edges
+        new_x = min(RIGHT_EDGE_MAX - 1, max(LEFT_EDGE_MAX + 1, catx + dx))
+        new_y = min(BOTTOM_EDGE_MAX - 1, max(TOP_EDGE_MAX + 1, caty + dy))
+        # Only a real move is saved for undo, pushing against an edge is not
+        if (new_x, new_y) != (catx, caty):
+            movement_history.append((catx, caty))  # Save previous position (tuple) for undo
+            catx, caty = new_x, new_y
+            cat_moved = True
+
+    # Update the cat's hitbox only when the cat position changed
+    if cat_moved:
+        cat_rect = pygame.Rect(
+            catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET,  # Left edge
+            caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET,  # Top edge
+            CAT_HIT_BOX_X_SIZE,
+            CAT_HIT_BOX_Y_SIZE
+        )
+        cat_moved = False
 
     # Draw the cat image on the screen at the current position (catx, caty are integers)
     DISPLAYSURF.blit(catImg, (catx, caty))
-    # You can also draw the hitbox polygon for debugging:
-    # pygame.draw.polygon(DISPLAYSURF, (0, 255, 255), cat_hit_box)
+    # You can also draw the hitbox rectangle for debugging:
+    # pygame.draw.rect(DISPLAYSURF, (0, 255, 255), cat_rect, 1)
 
-    # If no prey selected, choose one randomly from the PREYS list
+    # If no prey selected, choose one randomly from the prey_items list
     if prey_is_not_selected:
-        prey_path = PREYS[random.randint(0, len(PREYS) - 1)]  # Pick a random string from list
-
-        # Extract the prey name from the file path string
-        prey_name = prey_path.split("/")[-1].split(".")[0]
-
-        # Load the prey image (surface object)
-        prey = pygame.image.load(prey_path)
+        # Pick a random (name, image) pair from the list in a single call
+        prey_name, prey = random.choice(prey_items)
 
         # Randomly place prey somewhere on the screen (integers)
         prey_x = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
         prey_y = random.randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
 
-        # Update prey hitbox (list of lists of floats)
-        prey_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
-        prey_hit_box[0][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[0][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[1][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[1][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[2][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[2][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[3][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[3][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
+        # Update prey hitbox once per spawn
+        prey_rect = pygame.Rect(
+            prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET,  # Left edge
+            prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET,  # Top edge
+            PREY_HIT_BOX_X_SIZE,
+            PREY_HIT_BOX_Y_SIZE
+        )
 
         prey_is_not_selected = False  # Now prey is selected
 
     # Draw the prey image at its position (prey_x, prey_y are integers)
     DISPLAYSURF.blit(prey, (prey_x, prey_y))
     # Debug draw prey hitbox:
-    # pygame.draw.polygon(DISPLAYSURF, (255, 0, 255), prey_hit_box)
+    # pygame.draw.rect(DISPLAYSURF, (255, 0, 255), prey_rect, 1)
 
     # ----------- Collision detection -----------
 
-    # Extract x and y coordinates from hitboxes using list comprehensions
-    cat_x_vals = [pt[0] for pt in cat_hit_box]
-    cat_y_vals = [pt[1] for pt in cat_hit_box]
-
-    prey_x_vals = [pt[0] for pt in prey_hit_box]
-    prey_y_vals = [pt[1] for pt in prey_hit_box]
+    # pygame.Rect does the overlap math in C: colliderect tells if the hitboxes overlap
+    # and clip returns the overlapping rectangle
+    if cat_rect.colliderect(prey_rect):
+        inter = cat_rect.clip(prey_rect)
+        inter_area = inter.width * inter.height  # Overlap area (int)
+        prey_area = prey_rect.width * prey_rect.height  # Prey hitbox area (int)
 
-    # Determine edges of rectangles (min and max of coordinate lists)
-    cat_left, cat_right = min(cat_x_vals), max(cat_x_vals)
-    cat_top, cat_bottom = min(cat_y_vals), max(cat_y_vals)
-
-    prey_left, prey_right = min(prey_x_vals), max(prey_x_vals)
-    prey_top, prey_bottom = min(prey_y_vals), max(prey_y_vals)
-
-    # Calculate overlap edges by comparing edges of cat and prey hitboxes
-    inter_left = max(cat_left, prey_left)
-    inter_right = min(cat_right, prey_right)
-    inter_top = max(cat_top, prey_top)
-    inter_bottom = min(cat_bottom, prey_bottom)
-
-    # Calculate overlap width and height (floats)
-    inter_width = inter_right - inter_left
-    inter_height = inter_bottom - inter_top
-
-    # Calculate intersection area if overlap exists (positive width and height)
-    inter_area = inter_width * inter_height if inter_width > 0 and inter_height > 0 else 0
-
-    # Calculate prey hitbox area
-    prey_area = (prey_right - prey_left) * (prey_bottom - prey_top)
-
-    # Calculate overlap ratio (float)
-    cat_prey_hit_box_ratio = inter_area / prey_area if prey_area > 0 else 0
+        # Calculate overlap ratio (float)
+        cat_prey_hit_box_ratio = inter_area / prey_area
+    else:
+        cat_prey_hit_box_ratio = 0
 
     # Check if the cat caught the prey based on collision ratio (boolean)
     cat_catch_the_prey = cat_prey_hit_box_ratio >= CAT_PREY_HIT_BOX_COLLISION_RATIO
@@ -341,13 +331,9 @@ while True:
 
         score += 1  # Increase player's score (integer)
 
-        # Add caught prey's name to the prey_history list (list of strings)
+        # Add caught prey's name to prey_history (maxlen=3 drops the oldest one)
         prey_history.append(prey_name)
 
-        # Keep only last 3 prey caught to limit history size
-        if len(prey_history) > 3:
-            prey_history.pop(0)  # Remove oldest item from list
-
         # Save position where prey was caught as a tuple (immutable pair of integers)
         caught_prey_positions.append((prey_x, prey_y))
 
@@ -358,28 +344,29 @@ while True:
     # ----------- UI Rendering -----------
 
     # Render the score on screen using font (score is int converted to string)
-    score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
+    score_surf = get_label(f"Score: {score}", (0, 0, 0))
     DISPLAYSURF.blit(score_surf, (10, 10))
 
     # Render last 3 caught prey names on screen (iterate over list of strings)
     for i, name in enumerate(prey_history):
-        label = font.render(f"Prey {i + 1}: {name}", True, (100, 100, 100))
+        label = get_label(f"Prey {i + 1}: {name}", (100, 100, 100))
         DISPLAYSURF.blit(label, (10, 50 + i * 30))
 
     # Show info about active lists (demonstrates length, contents, etc.)
+    for i, label in enumerate(static_list_labels):
+        DISPLAYSURF.blit(label, (WINDOW_WIDTH - 500, 10 + i * 28))
+
     list_labels = [
-        f"Active Lists:",
-        f"- PREYS: {len(PREYS)} items",  # Number of prey types (int)
-        f"- prey_history: {prey_history}",  # List of strings
-        f"- movement_history: {len(movement_history)} steps",  # List length (int)
+        f"- prey_history: {list(prey_history)}",  # Names as a list of strings
+        f"- movement_history: {len(movement_history)} steps",  # Deque length (int)
         f"- score_log: {score_log}",  # List of scores (ints)
         f"- caught_prey_positions: {len(caught_prey_positions)}",  # List length
         f"- special_rewards: {special_rewards}",  # List of reward strings
         f"- frame_timeline (len): {len(frame_timeline)}"  # List length of timestamps
     ]
 
-    for i, text in enumerate(list_labels):
-        label = font.render(text, True, (50, 50, 50))
+    for i, text in enumerate(list_labels, start=len(static_list_labels)):
+        label = get_label(text)
         DISPLAYSURF.blit(label, (WINDOW_WIDTH - 500, 10 + i * 28))
 
     # Update the screen and keep the FPS stable
@@ -399,7 +386,7 @@ while True:
 # - Explain why certain values or choices are made (like screen edges or collision ratio).
 # - Describe the flow of logic (e.g., what happens when a key is pressed or a collision occurs).
 # - Indicate sections of the program for easier navigation (like "Main game loop" or "Collision detection").
-# - Provide debugging aids (e.g., printing hitbox coordinates or drawing polygons).
+# - Provide debugging aids (e.g., printing hitbox coordinates or drawing hitbox rectangles).
 
 # Good commenting practices help prevent confusion, save time debugging,
 # and improve collaboration with others.
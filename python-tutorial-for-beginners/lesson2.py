@@ -2,6 +2,8 @@ import pygame
 import sys
 from pygame.locals import *
 import random
+import heapq
+from collections import deque
 
 pygame.init()
 
@@ -15,6 +17,9 @@ RIGHT_EDGE_MAX = WINDOW_WIDTH - 120
 BOTTOM_EDGE_MAX = WINDOW_HEIGHT - 120
 TOP_EDGE_MAX = 10
 
+# Arrow key -> (dx, dy) step for the cat
+MOVES = {K_RIGHT: (10, 0), K_LEFT: (-10, 0), K_DOWN: (0, 10), K_UP: (0, -10)}
+
 # This creates the game window where everything will be shown
 DISPLAYSURF = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), 0, 32)
 pygame.display.set_caption('Cat Catch Game with Lists')
@@ -24,8 +29,15 @@ WHITE = (255, 255, 255)  # RGB color for white
 # Path where the image files are stored
 RESOURCES_PATH = "D:/workspace/System-Design-and-Api-dev-roadmap/python-tutorial-for-beginners/resources/"
 
+
+# Loads an image already converted to the screen's pixel format for fast blits
+def load_image(path):
+    # convert_alpha() keeps the image's own transparency or color key
+    return pygame.image.load(path).convert_alpha()
+
+
 # Load the cat image that the player controls
-catImg = pygame.image.load(RESOURCES_PATH + "cat.png")
+catImg = load_image(RESOURCES_PATH + "cat.png")
 
 # Randomly place the cat somewhere on the screen initially
 catx = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
@@ -47,13 +59,27 @@ caty = random.randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
 # Using print() statements during development makes finding and fixing bugs easier.
 # -----------------------------------------
 
-# Hitbox coordinates for the cat (used for collision detection)
-cat_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
+# print() looks up its sep, end and file arguments (and sys.stdout itself) on every call.
+# fast_print() binds sys.stdout.write once and just writes the joined text, which is
+# noticeably cheaper when you log from inside a loop. The output is the same as print().
+_w = sys.stdout.write
+
+
+def fast_print(*args, sep=" ", end="\n"):
+    _w(sep.join(map(str, args)))
+    _w(end)
 
+
+# Hitbox size and offset for the cat (used for collision detection)
 CAT_HIT_BOX_X_SIZE = 80
 CAT_HIT_BOX_Y_SIZE = 80
 CAT_HIT_BOX_X_OFFSET = 40
 CAT_HIT_BOX_Y_OFFSET = 40
+# Image position -> hitbox top-left, precomputed once in integer math (both are 0 here)
+CAT_HIT_BOX_LEFT = CAT_HIT_BOX_X_OFFSET - CAT_HIT_BOX_X_SIZE // 2
+CAT_HIT_BOX_TOP = CAT_HIT_BOX_Y_OFFSET - CAT_HIT_BOX_Y_SIZE // 2
+cat_rect = pygame.Rect(0, 0, 0, 0)  # Cat hitbox as (left, top, width, height), updated when the cat moves
+cat_moved = True  # True on the first frame so the hitbox gets built once
 
 # List of prey image paths - different animals the cat can catch
 PREYS = [
@@ -64,13 +90,18 @@ PREYS = [
     RESOURCES_PATH + "lizard.png"
 ]
 
-# Hitbox coordinates for the prey
-prey_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
+# Prey images and names are worked out once at startup instead of on every spawn
+# (the name is the file name without folder and extension, like "rat" or "spider")
+PREY_SURFACES = [load_image(path) for path in PREYS]
+PREY_NAMES = [path.rsplit("/", 1)[-1].rsplit(".", 1)[0] for path in PREYS]
 
+# Hitbox size and offset for the prey
 PREY_HIT_BOX_X_SIZE = 48
 PREY_HIT_BOX_Y_SIZE = 48
 PREY_HIT_BOX_X_OFFSET = 24
 PREY_HIT_BOX_Y_OFFSET = 24
+PREY_HIT_BOX_LEFT = PREY_HIT_BOX_X_OFFSET - PREY_HIT_BOX_X_SIZE // 2
+PREY_HIT_BOX_TOP = PREY_HIT_BOX_Y_OFFSET - PREY_HIT_BOX_Y_SIZE // 2
 
 CAT_PREY_HIT_BOX_COLLISION_RATIO = 0.75
 
@@ -79,151 +110,178 @@ score = 0
 
 font = pygame.font.Font(None, 36)
 
-prey_history = []
-movement_history = []
+LABEL_COLOR = (50, 50, 50)
+
+# Labels that never change are rendered once, the score only when a prey is caught
+STATIC_LABELS = [
+    font.render("Active Lists:", True, LABEL_COLOR),
+    font.render(f"- PREYS: {len(PREYS)} items", True, LABEL_COLOR)
+]
+score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
+# Values the changing list labels were last rendered with
+last_history_key = last_moves_len = last_score_log_len = None
+last_caught_len = last_rewards_len = last_timeline_len = None
+
+prey_history = deque(maxlen=3)
+prey_label_cache = []  # Rendered prey_history labels, rebuilt on each catch
+movement_history = deque(maxlen=256)  # Only the last 256 moves can be undone
 score_log = []
 caught_prey_positions = []
 special_rewards = []
-frame_timeline = []
+frame_timeline = deque(maxlen=100)
 
 prey_name = None
 
-while True:
-    DISPLAYSURF.fill(WHITE)
+# Bound once so each spawn skips the random.<name> attribute lookup
+_randint = random.randint
+_randrange = random.randrange
+NUM_PREYS = len(PREY_SURFACES)
+
+# Dirty rects: only the screen areas drawn last frame are erased and sent to the display,
+# and a frame where nothing visible changed isn't redrawn at all.
+# Starting with the whole window makes the first frame clear and show everything.
+drawn_rects = [DISPLAYSURF.get_rect()]
+last_frame_state = None
+# Old drawings are erased by copying the same area of a white background over them
+BACKGROUND = pygame.Surface(DISPLAYSURF.get_size()).convert()
+BACKGROUND.fill(WHITE)
+
+# Functions called every frame, bound once to skip the attribute lookups
+_get_ticks = pygame.time.get_ticks
+_event_get = pygame.event.get
+_blits = DISPLAYSURF.blits
+_update = pygame.display.update
+_tick = fpsClock.tick
 
-    frame_timeline.append(pygame.time.get_ticks())
-    if len(frame_timeline) > 100:
-        frame_timeline.pop(0)
+while True:
+    frame_timeline.append(_get_ticks())
 
-    for event in pygame.event.get():
+    for event in _event_get():
         if event.type == QUIT:
             # When quitting, print leaderboard and rewards for review/debug
-            print("Leaderboard (this session):", sorted(score_log, reverse=True))
-            print("Special Rewards Earned:", special_rewards)
+            fast_print("Leaderboard (this session):", heapq.nlargest(10, score_log))
+            fast_print("Special Rewards Earned:", special_rewards)
 
             pygame.quit()
             sys.exit()
 
+        if event.type in (WINDOWEXPOSED, VIDEOEXPOSE):
+            # The window was uncovered, so the next frame redraws everything
+            last_frame_state = None
+            drawn_rects = [DISPLAYSURF.get_rect()]
+
         if event.type == KEYDOWN:
-            keys = pygame.key.get_pressed()
+            k = event.key
 
-            if keys[K_RIGHT]:
+            if k in MOVES:
+                dx, dy = MOVES[k]
                 movement_history.append((catx, caty))
-                catx += 10
-                if catx >= RIGHT_EDGE_MAX:
-                    catx -= 10
-            elif keys[K_DOWN]:
-                movement_history.append((catx, caty))
-                caty += 10
-                if caty >= BOTTOM_EDGE_MAX:
-                    caty -= 10
-            elif keys[K_LEFT]:
-                movement_history.append((catx, caty))
-                catx -= 10
-                if catx <= LEFT_EDGE_MAX:
-                    catx += 10
-            elif keys[K_UP]:
-                movement_history.append((catx, caty))
-                caty -= 10
-                if caty <= TOP_EDGE_MAX:
-                    caty += 10
-            elif keys[K_u]:  # Undo last move
+                catx = max(LEFT_EDGE_MAX + 1, min(RIGHT_EDGE_MAX - 1, catx + dx))
+                caty = max(TOP_EDGE_MAX + 1, min(BOTTOM_EDGE_MAX - 1, caty + dy))
+                cat_moved = True
+            elif k == K_u:  # Undo last move
                 if movement_history:
                     catx, caty = movement_history.pop()
-            elif keys[K_c]:
+                    cat_moved = True
+            elif k == K_c:
                 # Print cat hitbox for debugging
-                print("Cat hitbox coordinates:", cat_hit_box)
+                fast_print("Cat hitbox rectangle:", cat_rect)
 
-    cat_hit_box[0][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[0][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[1][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[1][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[2][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[2][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[3][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[3][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-
-    DISPLAYSURF.blit(catImg, (catx, caty))
+    if cat_moved:
+        cat_rect = pygame.Rect(
+            catx + CAT_HIT_BOX_LEFT,
+            caty + CAT_HIT_BOX_TOP,
+            CAT_HIT_BOX_X_SIZE,
+            CAT_HIT_BOX_Y_SIZE
+        )
+        cat_moved = False
 
     if prey_is_not_selected:
-        prey_path = PREYS[random.randint(0, len(PREYS)-1)]
-        prey_name = prey_path.split("/")[-1].split(".")[0]
-        prey = pygame.image.load(prey_path)
-        prey_x = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
-        prey_y = random.randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
-
-        prey_hit_box[0][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[0][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[1][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[1][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[2][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[2][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[3][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[3][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
+        i = _randrange(NUM_PREYS)
+        prey = PREY_SURFACES[i]
+        prey_name = PREY_NAMES[i]
+        prey_x = _randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
+        prey_y = _randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
+
+        prey_rect = pygame.Rect(
+            prey_x + PREY_HIT_BOX_LEFT,
+            prey_y + PREY_HIT_BOX_TOP,
+            PREY_HIT_BOX_X_SIZE,
+            PREY_HIT_BOX_Y_SIZE
+        )
 
         prey_is_not_selected = False
 
-    DISPLAYSURF.blit(prey, (prey_x, prey_y))
-
-    cat_x_vals = [pt[0] for pt in cat_hit_box]
-    cat_y_vals = [pt[1] for pt in cat_hit_box]
-
-    prey_x_vals = [pt[0] for pt in prey_hit_box]
-    prey_y_vals = [pt[1] for pt in prey_hit_box]
-
-    cat_left, cat_right = min(cat_x_vals), max(cat_x_vals)
-    cat_top, cat_bottom = min(cat_y_vals), max(cat_y_vals)
-
-    prey_left, prey_right = min(prey_x_vals), max(prey_x_vals)
-    prey_top, prey_bottom = min(prey_y_vals), max(prey_y_vals)
-
-    inter_left = max(cat_left, prey_left)
-    inter_right = min(cat_right, prey_right)
-    inter_top = max(cat_top, prey_top)
-    inter_bottom = min(cat_bottom, prey_bottom)
-
-    inter_width = inter_right - inter_left
-    inter_height = inter_bottom - inter_top
-
-    inter_area = inter_width * inter_height if inter_width > 0 and inter_height > 0 else 0
-    prey_area = (prey_right - prey_left) * (prey_bottom - prey_top)
-
-    cat_prey_hit_box_ratio = inter_area / prey_area if prey_area > 0 else 0
+    if cat_rect.colliderect(prey_rect):
+        inter = cat_rect.clip(prey_rect)
+        cat_prey_hit_box_ratio = (inter.width * inter.height) / (prey_rect.width * prey_rect.height)
+    else:
+        cat_prey_hit_box_ratio = 0
 
     cat_catch_the_prey = cat_prey_hit_box_ratio >= CAT_PREY_HIT_BOX_COLLISION_RATIO
     if cat_catch_the_prey:
         prey_is_not_selected = True
         score += 1
+        score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
         prey_history.append(prey_name)
-        if len(prey_history) > 3:
-            prey_history.pop(0)
+        prey_label_cache = [
+            font.render(f"Prey {i+1}: {name}", True, (100, 100, 100))
+            for i, name in enumerate(prey_history)
+        ]
         caught_prey_positions.append((prey_x, prey_y))
         if prey_name == "lizard":
             special_rewards.append("+5 bonus points")
 
-    score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
-    DISPLAYSURF.blit(score_surf, (10, 10))
-
-    for i, name in enumerate(prey_history):
-        label = font.render(f"Prey {i+1}: {name}", True, (100, 100, 100))
-        DISPLAYSURF.blit(label, (10, 50 + i * 30))
-
-    list_labels = [
-        f"Active Lists:",
-        f"- PREYS: {len(PREYS)} items",
-        f"- prey_history: {prey_history}",
-        f"- movement_history: {len(movement_history)} steps",
-        f"- score_log: {score_log}",
-        f"- caught_prey_positions: {len(caught_prey_positions)}",
-        f"- special_rewards: {special_rewards}",
-        f"- frame_timeline (len): {len(frame_timeline)}"
-    ]
-    for i, text in enumerate(list_labels):
-        label = font.render(text, True, (50, 50, 50))
-        DISPLAYSURF.blit(label, (WINDOW_WIDTH - 500, 10 + i * 28))
-
-    pygame.display.update()
-    fpsClock.tick(FPS)
+    frame_state = (
+        catx, caty, prey_x, prey_y, prey_name, score, len(movement_history),
+        len(score_log), len(caught_prey_positions), len(special_rewards), len(frame_timeline)
+    )
+    if frame_state != last_frame_state:
+        last_frame_state = frame_state
+
+        # Erasing and drawing are collected as blits() entries and done in a single call
+        frame_blits = [(BACKGROUND, rect, rect) for rect in drawn_rects]
+        erase_count = len(frame_blits)
+        frame_blits += [
+            (catImg, (catx, caty)),
+            (prey, (prey_x, prey_y))
+        ]
+
+        frame_blits.append((score_surf, (10, 10)))
+
+        frame_blits.extend((label, (10, 50 + i * 30)) for i, label in enumerate(prey_label_cache))
+
+        frame_blits.extend((label, (WINDOW_WIDTH - 500, 10 + i * 28)) for i, label in enumerate(STATIC_LABELS))
+
+        history_key = tuple(prey_history)
+        if history_key != last_history_key:
+            last_history_key = history_key
+            history_surf = font.render(f"- prey_history: {list(prey_history)}", True, LABEL_COLOR)
+        if len(movement_history) != last_moves_len:
+            last_moves_len = len(movement_history)
+            moves_surf = font.render(f"- movement_history: {last_moves_len} steps", True, LABEL_COLOR)
+        if len(score_log) != last_score_log_len:
+            last_score_log_len = len(score_log)
+            score_log_surf = font.render(f"- score_log: {score_log}", True, LABEL_COLOR)
+        if len(caught_prey_positions) != last_caught_len:
+            last_caught_len = len(caught_prey_positions)
+            caught_surf = font.render(f"- caught_prey_positions: {last_caught_len}", True, LABEL_COLOR)
+        if len(special_rewards) != last_rewards_len:
+            last_rewards_len = len(special_rewards)
+            rewards_surf = font.render(f"- special_rewards: {special_rewards}", True, LABEL_COLOR)
+        if len(frame_timeline) != last_timeline_len:
+            last_timeline_len = len(frame_timeline)
+            timeline_surf = font.render(f"- frame_timeline (len): {last_timeline_len}", True, LABEL_COLOR)
+
+        list_labels = [history_surf, moves_surf, score_log_surf, caught_surf, rewards_surf, timeline_surf]
+        for i, label in enumerate(list_labels, start=len(STATIC_LABELS)):
+            frame_blits.append((label, (WINDOW_WIDTH - 500, 10 + i * 28)))
+
+        changed_rects = _blits(frame_blits)
+        drawn_rects = changed_rects[erase_count:]
+        _update(changed_rects)
+
+    _tick(FPS)
 
 
 # -----------------------------------------
@@ -2,6 +2,8 @@ import pygame
 import sys
 from pygame.locals import *
 import random
+import heapq
+from collections import deque
 
 pygame.init()
 
@@ -15,6 +17,9 @@ RIGHT_EDGE_MAX = WINDOW_WIDTH - 120
 BOTTOM_EDGE_MAX = WINDOW_HEIGHT - 120
 TOP_EDGE_MAX = 10
 
+# How far each arrow key moves the cat as (dx, dy), looked up with the pressed key
+MOVES = {K_RIGHT: (10, 0), K_LEFT: (-10, 0), K_DOWN: (0, 10), K_UP: (0, -10)}
+
 # This creates the game window where everything will be shown
 DISPLAYSURF = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), 0, 32)
 pygame.display.set_caption('Cat Catch Game with Lists')
@@ -24,8 +29,16 @@ WHITE = (255, 255, 255)  # RGB color for white
 # Path where the image files are stored
 RESOURCES_PATH = "D:/workspace/System-Design-and-Api-dev-roadmap/python-tutorial-for-beginners/resources/"
 
+
+# Images are converted once to the screen's pixel format when loaded,
+# so blitting them every frame is a straight copy instead of a conversion
+def load_image(path):
+    # convert_alpha() keeps the image's own transparency or color key
+    return pygame.image.load(path).convert_alpha()
+
+
 # Load the cat image that the player controls
-catImg = pygame.image.load(RESOURCES_PATH + "cat.png")
+catImg = load_image(RESOURCES_PATH + "cat.png")
 
 # Randomly place the cat somewhere on the screen initially
 catx = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
@@ -39,13 +52,19 @@ caty = random.randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
 # You can think of a list as a numbered row of boxes, where each box holds one piece of information.
 # -----------------------------------------
 
-# This list stores the 4 corner points of the cat's hitbox (the area that detects collisions)
-cat_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
-
+# The hitboxes (the areas that detect collisions) are rectangles, so each one is kept
+# as a pygame.Rect built from its left and top edges plus its width and height
 CAT_HIT_BOX_X_SIZE = 80  # Width of cat hitbox
 CAT_HIT_BOX_Y_SIZE = 80  # Height of cat hitbox
 CAT_HIT_BOX_X_OFFSET = 40
 CAT_HIT_BOX_Y_OFFSET = 40
+# Distance from the image position to the hitbox's top-left corner, worked out once here
+# so building a hitbox only needs one addition per axis. // is integer division, so these
+# stay whole numbers (ints); with these sizes they are 0, the hitbox starts at the image position
+CAT_HIT_BOX_LEFT = CAT_HIT_BOX_X_OFFSET - CAT_HIT_BOX_X_SIZE // 2
+CAT_HIT_BOX_TOP = CAT_HIT_BOX_Y_OFFSET - CAT_HIT_BOX_Y_SIZE // 2
+cat_rect = pygame.Rect(0, 0, 0, 0)  # Cat hitbox as (left, top, width, height), updated when the cat moves
+cat_moved = True  # True on the first frame so the hitbox gets built once
 
 # Here is a LIST of prey image paths
 # This is a collection of different animals the cat can catch
@@ -57,13 +76,17 @@ PREYS = [
     RESOURCES_PATH + "lizard.png"
 ]  
 
-# Another list to store hitbox points for the prey (same as the cat, but smaller)
-prey_hit_box = [[0, 0], [0, 0], [0, 0], [0, 0]]
+# Two lists built from PREYS when the game starts, so no file is read while playing:
+# the loaded prey images and their names (like "rat" or "spider"), in the same order
+PREY_SURFACES = [load_image(path) for path in PREYS]
+PREY_NAMES = [path.rsplit("/", 1)[-1].rsplit(".", 1)[0] for path in PREYS]
 
 PREY_HIT_BOX_X_SIZE = 48
 PREY_HIT_BOX_Y_SIZE = 48
 PREY_HIT_BOX_X_OFFSET = 24
 PREY_HIT_BOX_Y_OFFSET = 24
+PREY_HIT_BOX_LEFT = PREY_HIT_BOX_X_OFFSET - PREY_HIT_BOX_X_SIZE // 2
+PREY_HIT_BOX_TOP = PREY_HIT_BOX_Y_OFFSET - PREY_HIT_BOX_Y_SIZE // 2
 
 CAT_PREY_HIT_BOX_COLLISION_RATIO = 0.75  # How much overlap means the cat caught the prey
 
@@ -73,15 +96,38 @@ score = 0  # Player's score
 # Font to display text on screen
 font = pygame.font.Font(None, 36)
 
+LABEL_COLOR = (50, 50, 50)  # Color of the list info labels
+
+# List of label images that never change, rendered once here instead of every frame
+STATIC_LABELS = [
+    font.render("Active Lists:", True, LABEL_COLOR),
+    font.render(f"- PREYS: {len(PREYS)} items", True, LABEL_COLOR)  # Number of prey types available
+]
+
+# The score label is rendered here for the starting score and again only when
+# the cat catches a prey, which is the only time the score changes
+score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
+
+# The list info labels are rendered again only when the value they show changes,
+# so each one remembers the value (or list length) it was last rendered with
+last_history_key = last_moves_len = last_score_log_len = None
+last_caught_len = last_rewards_len = last_timeline_len = None
+
 # -----------------------------------------
 # More LISTS in this game and their purpose:
 # -----------------------------------------
 
-# List to keep the last 3 caught prey names (history)
-prey_history = []
+# Keeps the last 3 caught prey names (history)
+# A deque is a list-like collection that can add and remove at both ends quickly;
+# with maxlen=3 it drops the oldest name by itself when a 4th one is added
+prey_history = deque(maxlen=3)
 
-# List to keep track of cat's previous positions for "undo" movement
-movement_history = []
+# List of the rendered "Prey 1: ..." labels, rebuilt only when prey_history changes
+prey_label_cache = []
+
+# Keeps the cat's last 256 positions for "undo" movement, older ones are dropped
+# so the history doesn't keep growing during a long game
+movement_history = deque(maxlen=256)
 
 # List to keep scores of this game session (like a leaderboard)
 score_log = []
@@ -92,155 +138,136 @@ caught_prey_positions = []
 # List for special rewards earned during the game
 special_rewards = []
 
-# List to log frame timestamps (used to track time in the game)
-frame_timeline = []
+# Logs the last 100 frame timestamps (used to track time in the game)
+frame_timeline = deque(maxlen=100)
 
 prey_name = None  # Keeps the current prey's name
 
+# Local names for the random functions used when a prey spawns, so Python doesn't
+# look up random.randint / random.randrange again on every spawn
+_randint = random.randint
+_randrange = random.randrange
+NUM_PREYS = len(PREY_SURFACES)  # Number of prey types, it never changes
+
+# List of the screen areas (rectangles) drawn in the last frame. Only these areas are erased
+# and sent to the display next time, instead of the whole window ("dirty rects").
+# It starts with the whole window so the first frame clears and shows everything.
+drawn_rects = [DISPLAYSURF.get_rect()]
+last_frame_state = None  # What was on screen last frame, to skip frames where nothing changed
+
+# A white image as big as the window, pieces of it are copied over old drawings to erase them
+BACKGROUND = pygame.Surface(DISPLAYSURF.get_size()).convert()
+BACKGROUND.fill(WHITE)
+
+# Short names for the functions called on every frame, looked up once here
+# instead of going through pygame.time, pygame.event, DISPLAYSURF... 60 times a second
+_get_ticks = pygame.time.get_ticks
+_event_get = pygame.event.get
+_blits = DISPLAYSURF.blits
+_update = pygame.display.update
+_tick = fpsClock.tick
+
 # -------------------
 # Main game loop starts here
 # -------------------
 while True:
-    DISPLAYSURF.fill(WHITE)  # Clear screen with white
-
     # Keep track of time frames, add current time in milliseconds to the list
-    frame_timeline.append(pygame.time.get_ticks())
-    if len(frame_timeline) > 100:  # Keep only the last 100 timestamps to save memory
-        frame_timeline.pop(0)  # Remove the oldest timestamp
+    # maxlen=100 keeps only the last 100 timestamps, removing the oldest in O(1)
+    frame_timeline.append(_get_ticks())
 
-    for event in pygame.event.get():
+    for event in _event_get():
         if event.type == QUIT:
             # When quitting, save the score in the score log list and print leaderboard
             score_log.append(score)
-            print("Leaderboard (this session):", sorted(score_log, reverse=True))
+            # heapq.nlargest picks the top 10 scores without sorting the whole list
+            print("Leaderboard (this session):", heapq.nlargest(10, score_log))
             print("Special Rewards Earned:", special_rewards)
             pygame.quit()
             sys.exit()
 
+        # When the window is uncovered or restored its contents may be lost,
+        # so forget the last frame and redraw the whole screen next time
+        if event.type in (WINDOWEXPOSED, VIDEOEXPOSE):
+            last_frame_state = None
+            drawn_rects = [DISPLAYSURF.get_rect()]
+
         if event.type == KEYDOWN:
-            keys = pygame.key.get_pressed()
+            k = event.key  # The key that was just pressed
 
             # When the player moves, save the current position in movement_history list
-            if keys[K_RIGHT]:
+            if k in MOVES:
+                dx, dy = MOVES[k]
                 movement_history.append((catx, caty))  # Save previous position
-                catx += 10
-                if catx >= RIGHT_EDGE_MAX:
-                    catx -= 10
-            elif keys[K_DOWN]:
-                movement_history.append((catx, caty))
-                caty += 10
-                if caty >= BOTTOM_EDGE_MAX:
-                    caty -= 10
-            elif keys[K_LEFT]:
-                movement_history.append((catx, caty))
-                catx -= 10
-                if catx <= LEFT_EDGE_MAX:
-                    catx += 10
-            elif keys[K_UP]:
-                movement_history.append((catx, caty))
-                caty -= 10
-                if caty <= TOP_EDGE_MAX:
-                    caty += 10
-            elif keys[K_u]:  # If 'u' is pressed, undo last movement
+                # Clamp the new position so the cat stays inside the window edges
+                catx = max(LEFT_EDGE_MAX + 1, min(RIGHT_EDGE_MAX - 1, catx + dx))
+                caty = max(TOP_EDGE_MAX + 1, min(BOTTOM_EDGE_MAX - 1, caty + dy))
+                cat_moved = True
+            elif k == K_u:  # If 'u' is pressed, undo last movement
                 if movement_history:
                     catx, caty = movement_history.pop()  # Go back to previous position
-            elif keys[K_c]:
-                print(cat_hit_box)  # Debug print hitbox coordinates
-
-    # Update the cat's hitbox coordinates based on the current cat position
-    cat_hit_box[0][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[0][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[1][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[1][1] = caty - CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[2][0] = catx + CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[2][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-    cat_hit_box[3][0] = catx - CAT_HIT_BOX_X_SIZE / 2 + CAT_HIT_BOX_X_OFFSET
-    cat_hit_box[3][1] = caty + CAT_HIT_BOX_Y_SIZE / 2 + CAT_HIT_BOX_Y_OFFSET
-
-    # Draw the cat image on the screen at the current position
-    DISPLAYSURF.blit(catImg, (catx, caty))
-    # You can also draw the hitbox polygon for debugging:
-    # pygame.draw.polygon(DISPLAYSURF, (0, 255, 255), cat_hit_box)
+                    cat_moved = True
+            elif k == K_c:
+                print(cat_rect)  # Debug print hitbox rectangle
+
+    # Update the cat's hitbox rectangle, only needed when the cat has moved
+    if cat_moved:
+        cat_rect = pygame.Rect(
+            catx + CAT_HIT_BOX_LEFT,
+            caty + CAT_HIT_BOX_TOP,
+            CAT_HIT_BOX_X_SIZE,
+            CAT_HIT_BOX_Y_SIZE
+        )
+        cat_moved = False
 
     # If no prey selected, choose one randomly from the PREYS list
     if prey_is_not_selected:
-        # Pick a random prey image path from the list
-        prey_path = PREYS[random.randint(0, len(PREYS)-1)]
-
-        # Extract the prey name from the path (like "rat" or "spider")
-        prey_name = prey_path.split("/")[-1].split(".")[0]
+        # Pick a random position in the prey lists
+        i = _randrange(NUM_PREYS)
 
-        # Load the prey image
-        prey = pygame.image.load(prey_path)
+        # The same position gives the prey image and its name
+        prey = PREY_SURFACES[i]
+        prey_name = PREY_NAMES[i]
 
         # Randomly place prey somewhere on the screen
-        prey_x = random.randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
-        prey_y = random.randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
-
-        # Update the prey hitbox coordinates in the same way as the cat
-        prey_hit_box[0][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[0][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[1][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[1][1] = prey_y - PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[2][0] = prey_x + PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[2][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
-        prey_hit_box[3][0] = prey_x - PREY_HIT_BOX_X_SIZE / 2 + PREY_HIT_BOX_X_OFFSET
-        prey_hit_box[3][1] = prey_y + PREY_HIT_BOX_Y_SIZE / 2 + PREY_HIT_BOX_Y_OFFSET
+        prey_x = _randint(LEFT_EDGE_MAX + 100, RIGHT_EDGE_MAX - 100)
+        prey_y = _randint(TOP_EDGE_MAX + 100, BOTTOM_EDGE_MAX - 100)
 
-        prey_is_not_selected = False  # We now have a prey on screen
+        # Build the prey hitbox rectangle once, the prey doesn't move until it is caught
+        prey_rect = pygame.Rect(
+            prey_x + PREY_HIT_BOX_LEFT,
+            prey_y + PREY_HIT_BOX_TOP,
+            PREY_HIT_BOX_X_SIZE,
+            PREY_HIT_BOX_Y_SIZE
+        )
 
-    # Draw the prey image on the screen
-    DISPLAYSURF.blit(prey, (prey_x, prey_y))
-    # Draw the prey hitbox polygon for debugging:
-    # pygame.draw.polygon(DISPLAYSURF, (255, 0, 255), prey_hit_box)
+        prey_is_not_selected = False  # We now have a prey on screen
 
     # ----------- Collision detection -----------
-    # Extract all x and y coordinates from cat's hitbox points
-    cat_x_vals = [pt[0] for pt in cat_hit_box]
-    cat_y_vals = [pt[1] for pt in cat_hit_box]
-
-    # Extract all x and y coordinates from prey's hitbox points
-    prey_x_vals = [pt[0] for pt in prey_hit_box]
-    prey_y_vals = [pt[1] for pt in prey_hit_box]
-
-    # Determine edges of cat hitbox rectangle
-    cat_left, cat_right = min(cat_x_vals), max(cat_x_vals)
-    cat_top, cat_bottom = min(cat_y_vals), max(cat_y_vals)
+    # pygame.Rect does the overlap math in C: colliderect tells if the hitboxes overlap
+    # and clip returns the overlapping (intersection) rectangle
+    if cat_rect.colliderect(prey_rect):
+        inter = cat_rect.clip(prey_rect)
 
-    # Determine edges of prey hitbox rectangle
-    prey_left, prey_right = min(prey_x_vals), max(prey_x_vals)
-    prey_top, prey_bottom = min(prey_y_vals), max(prey_y_vals)
-
-    # Calculate overlap (intersection) between cat and prey hitboxes
-    inter_left = max(cat_left, prey_left)
-    inter_right = min(cat_right, prey_right)
-    inter_top = max(cat_top, prey_top)
-    inter_bottom = min(cat_bottom, prey_bottom)
-
-    inter_width = inter_right - inter_left
-    inter_height = inter_bottom - inter_top
-
-    # Calculate intersection area, only if they overlap
-    inter_area = inter_width * inter_height if inter_width > 0 and inter_height > 0 else 0
-
-    # Calculate prey area (hitbox size)
-    prey_area = (prey_right - prey_left) * (prey_bottom - prey_top)
-
-    # Calculate ratio of overlap area to prey area
-    cat_prey_hit_box_ratio = inter_area / prey_area if prey_area > 0 else 0
+        # Calculate ratio of overlap area to prey area (hitbox size)
+        cat_prey_hit_box_ratio = (inter.width * inter.height) / (prey_rect.width * prey_rect.height)
+    else:
+        cat_prey_hit_box_ratio = 0
 
     # Check if the cat caught the prey (overlap ratio is enough)
     cat_catch_the_prey = cat_prey_hit_box_ratio >= CAT_PREY_HIT_BOX_COLLISION_RATIO
     if cat_catch_the_prey:
         prey_is_not_selected = True  # Need to select a new prey
         score += 1  # Increase score
+        score_surf = font.render(f"Score: {score}", True, (0, 0, 0))  # New score label
 
-        # Add the caught prey's name to the prey_history list
+        # Add the caught prey's name to prey_history (maxlen=3 drops the oldest one)
         prey_history.append(prey_name)
 
-        # Keep only the last 3 caught prey in history
-        if len(prey_history) > 3:
-            prey_history.pop(0)  # Remove oldest caught prey
+        # prey_history changed, so render its labels again
+        prey_label_cache = [
+            font.render(f"Prey {i+1}: {name}", True, (100, 100, 100))
+            for i, name in enumerate(prey_history)
+        ]
 
         # Save the position where the prey was caught
         caught_prey_positions.append((prey_x, prey_y))
@@ -249,35 +276,83 @@ while True:
         if prey_name == "lizard":
             special_rewards.append("+5 bonus points")
 
-    # ----------- UI rendering -----------
-
-    # Display score on screen
-    score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
-    DISPLAYSURF.blit(score_surf, (10, 10))
-
-    # Display last 3 caught prey names on screen
-    for i, name in enumerate(prey_history):
-        label = font.render(f"Prey {i+1}: {name}", True, (100, 100, 100))
-        DISPLAYSURF.blit(label, (10, 50 + i * 30))
-
-    # Display info about active lists (collections) on the right side of screen
-    list_labels = [
-        f"Active Lists:",
-        f"- PREYS: {len(PREYS)} items",  # Number of prey types available
-        f"- prey_history: {prey_history}",  # Names of last caught prey
-        f"- movement_history: {len(movement_history)} steps",  # Number of moves stored
-        f"- score_log: {score_log}",  # Scores recorded this session
-        f"- caught_prey_positions: {len(caught_prey_positions)}",  # Positions saved
-        f"- special_rewards: {special_rewards}",  # Rewards earned
-        f"- frame_timeline (len): {len(frame_timeline)}"  # Time stamps stored
-    ]
-    for i, text in enumerate(list_labels):
-        label = font.render(text, True, (50, 50, 50))
-        DISPLAYSURF.blit(label, (WINDOW_WIDTH - 500, 10 + i * 28))
-
-    # Update the screen and keep FPS stable
-    pygame.display.update()
-    fpsClock.tick(FPS)
+    # ----------- Drawing -----------
+
+    # Everything that decides what the screen shows, put together in one tuple
+    frame_state = (
+        catx, caty, prey_x, prey_y, prey_name, score, len(movement_history),
+        len(score_log), len(caught_prey_positions), len(special_rewards), len(frame_timeline)
+    )
+
+    # Only redraw when something on screen changed
+    if frame_state != last_frame_state:
+        last_frame_state = frame_state
+
+        # List of (image, position) pairs to draw this frame, they are all drawn
+        # together with one blits() call at the end.
+        # It starts by erasing last frame's drawings: (image, position, area) copies
+        # just that area of the white background back over each old drawing
+        frame_blits = [(BACKGROUND, rect, rect) for rect in drawn_rects]
+        erase_count = len(frame_blits)
+        frame_blits += [
+            (catImg, (catx, caty)),  # Draw the cat at the current position
+            (prey, (prey_x, prey_y))  # Draw the prey
+        ]
+        # You can also draw the hitboxes for debugging:
+        # pygame.draw.rect(DISPLAYSURF, (0, 255, 255), cat_rect, 1)
+        # pygame.draw.rect(DISPLAYSURF, (255, 0, 255), prey_rect, 1)
+
+        # Display score on screen
+        frame_blits.append((score_surf, (10, 10)))
+
+        # Display last 3 caught prey names on screen
+        frame_blits.extend((label, (10, 50 + i * 30)) for i, label in enumerate(prey_label_cache))
+
+        # Display info about active lists (collections) on the right side of screen
+        frame_blits.extend((label, (WINDOW_WIDTH - 500, 10 + i * 28)) for i, label in enumerate(STATIC_LABELS))
+
+        # These labels change while playing, so each one is rendered again only when
+        # its value changes. score_log and special_rewards only grow, so their length
+        # is enough to tell if they changed.
+        # Names of last caught prey
+        history_key = tuple(prey_history)
+        if history_key != last_history_key:
+            last_history_key = history_key
+            history_surf = font.render(f"- prey_history: {list(prey_history)}", True, LABEL_COLOR)
+        # Number of moves stored
+        if len(movement_history) != last_moves_len:
+            last_moves_len = len(movement_history)
+            moves_surf = font.render(f"- movement_history: {last_moves_len} steps", True, LABEL_COLOR)
+        # Scores recorded this session
+        if len(score_log) != last_score_log_len:
+            last_score_log_len = len(score_log)
+            score_log_surf = font.render(f"- score_log: {score_log}", True, LABEL_COLOR)
+        # Positions saved
+        if len(caught_prey_positions) != last_caught_len:
+            last_caught_len = len(caught_prey_positions)
+            caught_surf = font.render(f"- caught_prey_positions: {last_caught_len}", True, LABEL_COLOR)
+        # Rewards earned
+        if len(special_rewards) != last_rewards_len:
+            last_rewards_len = len(special_rewards)
+            rewards_surf = font.render(f"- special_rewards: {special_rewards}", True, LABEL_COLOR)
+        # Time stamps stored
+        if len(frame_timeline) != last_timeline_len:
+            last_timeline_len = len(frame_timeline)
+            timeline_surf = font.render(f"- frame_timeline (len): {last_timeline_len}", True, LABEL_COLOR)
+
+        list_labels = [history_surf, moves_surf, score_log_surf, caught_surf, rewards_surf, timeline_surf]
+        for i, label in enumerate(list_labels, start=len(STATIC_LABELS)):
+            frame_blits.append((label, (WINDOW_WIDTH - 500, 10 + i * 28)))
+
+        # Erase and draw everything in one call, blits() returns the rectangles it drew on
+        changed_rects = _blits(frame_blits)
+        drawn_rects = changed_rects[erase_count:]  # Skip the erased areas, keep the new drawings
+
+        # Send only the erased and newly drawn areas to the display
+        _update(changed_rects)
+
+    # Keep FPS stable
+    _tick(FPS)
 
 # -----------------------------------------
 # What is a LIST and why do we use it here?
@@ -295,6 +370,8 @@ while True:
 # - special_rewards: Logs any bonus rewards earned during play.
 # - frame_timeline: Tracks game time frame by frame, useful for timing events.
 #
+# prey_history, movement_history and frame_timeline are deques: list-like collections that drop their oldest item once full.
+#
 # Using lists allows the game to dynamically manage multiple pieces of related data,
 # making it easier to update, display, and analyze as the game runs.
 # -----------------------------------------